@@ -4,9 +4,15 @@ from tkinter import filedialog, ttk, scrolledtext, messagebox
 import json
 from pathlib import Path
 import re
+from fnmatch import fnmatch
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
 
 class SvgIconGenerator:
+    # Combined length of all path data in one icon above which it is reported as oversized
+    MAX_PATH_DATA_LENGTH = 20000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("SVG Icon Component Generator")
@@ -35,9 +41,36 @@ class SvgIconGenerator:
         # Framework selection
         self.framework = tk.StringVar(value="Vue")
         
+        # Output mode ("Per File" writes one component per file, "Bundle" writes sharded modules)
+        self.output_mode = tk.StringVar(value="Per File")
+        
+        # Number of components per bundle module (0 = everything in a single module)
+        self.shard_size = tk.StringVar(value="0")
+        
+        # Lazy-loading registry output (dynamic imports plus a generic Icon component)
+        self.lazy_registry = tk.BooleanVar(value=False)
+        
+        # Group registry chunks by source subfolder
+        self.group_chunks = tk.BooleanVar(value=False)
+        
+        # Pre-flight validation before generation
+        self.validate_first = tk.BooleanVar(value=True)
+        
+        # Abort the batch when validation reports errors
+        self.fail_on_errors = tk.BooleanVar(value=True)
+        
         # Search filter
         self.search_text = tk.StringVar(value="")
         
+        # Saved generation profiles, keyed by name
+        self.profiles = {}
+        
+        # Profile editor fields
+        self.profile_name = tk.StringVar(value="")
+        self.profile_include = tk.StringVar(value="")
+        self.profile_exclude = tk.StringVar(value="")
+        self.profile_preserve_structure = tk.BooleanVar(value=False)
+        
         # Load saved configuration
         self.load_config()
         
@@ -61,6 +94,7 @@ class SvgIconGenerator:
         
         # Update the combo boxes with recent paths
         self.update_recent_paths()
+        self.update_profile_list()
         
         # Update button text based on framework
         self.framework.trace_add("write", self.update_button_text)
@@ -120,6 +154,26 @@ class SvgIconGenerator:
         framework_combo['values'] = ("Vue", "React")
         framework_combo.pack(side=tk.LEFT, padx=2)
         
+        # Output mode settings
+        output_frame = ttk.Frame(top_frame)
+        output_frame.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(output_frame, text="Output Mode:").pack(side=tk.LEFT, padx=2)
+        output_mode_combo = ttk.Combobox(output_frame, textvariable=self.output_mode, width=10, state="readonly")
+        output_mode_combo['values'] = ("Per File", "Bundle")
+        output_mode_combo.pack(side=tk.LEFT, padx=2)
+        
+        ttk.Label(output_frame, text="Shard Size:").pack(side=tk.LEFT, padx=2)
+        shard_spinbox = ttk.Spinbox(output_frame, textvariable=self.shard_size, from_=0, to=100000, increment=100, width=8)
+        shard_spinbox.pack(side=tk.LEFT, padx=2)
+        ttk.Label(output_frame, text="(0 = single module)").pack(side=tk.LEFT, padx=2)
+        
+        registry_check = ttk.Checkbutton(output_frame, text="Lazy Registry", variable=self.lazy_registry)
+        registry_check.pack(side=tk.LEFT, padx=2)
+        
+        group_chunks_check = ttk.Checkbutton(output_frame, text="Chunk by Folder", variable=self.group_chunks)
+        group_chunks_check.pack(side=tk.LEFT, padx=2)
+        
         # File filter
         filter_frame = ttk.Frame(top_frame)
         filter_frame.pack(fill=tk.X, pady=2)
@@ -168,7 +222,48 @@ class SvgIconGenerator:
         # Bind selection event
         self.file_tree.bind("<<TreeviewSelect>>", self.on_file_selected)
         
-        # Tab 2: Component Preview
+        # Tab 2: Profiles
+        profiles_tab = ttk.Frame(notebook)
+        notebook.add(profiles_tab, text="Profiles")
+        
+        # Profile selection and actions
+        profile_frame = ttk.Frame(profiles_tab)
+        profile_frame.pack(fill=tk.X, padx=2, pady=2)
+        
+        ttk.Label(profile_frame, text="Profile:").pack(side=tk.LEFT, padx=2)
+        self.profile_combo = ttk.Combobox(profile_frame, textvariable=self.profile_name, width=25)
+        self.profile_combo.pack(side=tk.LEFT, padx=2)
+        self.profile_combo.bind("<<ComboboxSelected>>", lambda event: self.load_profile())
+        
+        ttk.Button(profile_frame, text="Save", command=self.save_profile, width=8).pack(side=tk.LEFT, padx=2)
+        ttk.Button(profile_frame, text="Delete", command=self.delete_profile, width=8).pack(side=tk.LEFT, padx=2)
+        ttk.Button(profile_frame, text="Run Profile", command=self.run_profile, width=12).pack(side=tk.LEFT, padx=2)
+        
+        # Include/exclude globs
+        include_frame = ttk.Frame(profiles_tab)
+        include_frame.pack(fill=tk.X, padx=2, pady=2)
+        
+        ttk.Label(include_frame, text="Include:").pack(side=tk.LEFT, padx=2)
+        ttk.Entry(include_frame, textvariable=self.profile_include).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        exclude_frame = ttk.Frame(profiles_tab)
+        exclude_frame.pack(fill=tk.X, padx=2, pady=2)
+        
+        ttk.Label(exclude_frame, text="Exclude:").pack(side=tk.LEFT, padx=2)
+        ttk.Entry(exclude_frame, textvariable=self.profile_exclude).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        ttk.Checkbutton(
+            profiles_tab,
+            text="Preserve directory structure",
+            variable=self.profile_preserve_structure
+        ).pack(anchor=tk.W, padx=2, pady=2)
+        
+        # Per-folder naming rules, one "pattern = prefix | suffix" per line
+        ttk.Label(profiles_tab, text="Folder Rules (pattern = prefix | suffix):").pack(anchor=tk.W, padx=2)
+        self.profile_rules_area = scrolledtext.ScrolledText(profiles_tab, wrap=tk.NONE, height=8)
+        self.profile_rules_area.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        # Tab 3: Component Preview
         preview_tab = ttk.Frame(notebook)
         notebook.add(preview_tab, text="Component Preview")
         
@@ -176,7 +271,7 @@ class SvgIconGenerator:
         self.preview_area = scrolledtext.ScrolledText(preview_tab, wrap=tk.WORD)
         self.preview_area.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         
-        # Tab 3: Log
+        # Tab 4: Log
         log_tab = ttk.Frame(notebook)
         notebook.add(log_tab, text="Log")
         
@@ -204,6 +299,20 @@ class SvgIconGenerator:
         )
         self.open_folder_btn.pack(side=tk.LEFT, padx=2)
         
+        self.validate_btn = ttk.Button(
+            generate_frame,
+            text="Validate",
+            command=self.validate_selected,
+            width=10
+        )
+        self.validate_btn.pack(side=tk.LEFT, padx=2)
+        
+        validate_first_check = ttk.Checkbutton(generate_frame, text="Validate First", variable=self.validate_first)
+        validate_first_check.pack(side=tk.LEFT, padx=2)
+        
+        fail_on_errors_check = ttk.Checkbutton(generate_frame, text="Fail on Errors", variable=self.fail_on_errors)
+        fail_on_errors_check.pack(side=tk.LEFT, padx=2)
+        
         # Status bar
         self.status_var = tk.StringVar()
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
@@ -233,6 +342,13 @@ class SvgIconGenerator:
                     self.component_prefix.set(config.get('component_prefix', ''))
                     self.component_suffix.set(config.get('component_suffix', 'Component'))
                     self.framework.set(config.get('framework', 'Vue'))
+                    self.output_mode.set(config.get('output_mode', 'Per File'))
+                    self.shard_size.set(str(config.get('shard_size', 0)))
+                    self.lazy_registry.set(config.get('lazy_registry', False))
+                    self.group_chunks.set(config.get('group_chunks', False))
+                    self.validate_first.set(config.get('validate_first', True))
+                    self.fail_on_errors.set(config.get('fail_on_errors', True))
+                    self.profiles = config.get('profiles', {})
         except Exception as e:
             self.log(f"Error loading config: {e}")
             self.recent_source_paths = []
@@ -245,7 +361,14 @@ class SvgIconGenerator:
                 'recent_dest_paths': self.recent_dest_paths,
                 'component_prefix': self.component_prefix.get(),
                 'component_suffix': self.component_suffix.get(),
-                'framework': self.framework.get()
+                'framework': self.framework.get(),
+                'output_mode': self.output_mode.get(),
+                'shard_size': self.get_shard_size(),
+                'lazy_registry': self.lazy_registry.get(),
+                'group_chunks': self.group_chunks.get(),
+                'validate_first': self.validate_first.get(),
+                'fail_on_errors': self.fail_on_errors.get(),
+                'profiles': self.profiles
             }
             
             with open(self.config_file, 'w') as f:
@@ -253,6 +376,25 @@ class SvgIconGenerator:
         except Exception as e:
             self.log(f"Error saving config: {e}")
             
+    def get_shard_size(self):
+        # Invalid or negative values fall back to a single module
+        try:
+            return max(0, int(self.shard_size.get()))
+        except (tk.TclError, ValueError):
+            return 0
+            
+    def get_generation_settings(self):
+        # Everything besides the file list and naming that controls a generation run
+        return {
+            'framework': self.framework.get(),
+            'output_mode': self.output_mode.get(),
+            'shard_size': self.get_shard_size(),
+            'lazy_registry': self.lazy_registry.get(),
+            'group_chunks': self.group_chunks.get(),
+            'validate_first': self.validate_first.get(),
+            'fail_on_errors': self.fail_on_errors.get()
+        }
+            
     def update_recent_paths(self):
         self.source_combo['values'] = self.recent_source_paths
         self.dest_combo['values'] = self.recent_dest_paths
@@ -327,6 +469,19 @@ class SvgIconGenerator:
         # Log start of scanning
         self.log(f"Scanning for SVG files in: {folder_path} (including subfolders)")
         
+        self.svg_files.extend(self.find_svg_files(folder_path))
+        
+        # Log number of files found
+        self.log(f"Found {len(self.svg_files)} SVG files")
+        
+        # Display files in the treeview
+        self.refresh_file_list()
+        
+        self.status_var.set(f"Found {len(self.svg_files)} SVG files in {folder_path} and subfolders")
+        
+    def find_svg_files(self, folder_path):
+        svg_files = []
+        
         # Find all SVG files in the folder and all subfolders (with recursion)
         for root, dirs, files in os.walk(folder_path):
             for file in files:
@@ -342,17 +497,11 @@ class SvgIconGenerator:
                     rel_path = os.path.relpath(file_path, folder_path)
                     
                     # Store file info
-                    self.svg_files.append((file_path, rel_path))
-        
-        # Log number of files found
-        self.log(f"Found {len(self.svg_files)} SVG files")
-        
-        # Display files in the treeview
-        self.refresh_file_list()
-        
-        self.status_var.set(f"Found {len(self.svg_files)} SVG files in {folder_path} and subfolders")
+                    svg_files.append((file_path, rel_path))
+                    
+        return svg_files
         
-    def get_component_name(self, rel_path):
+    def get_component_name(self, rel_path, prefix=None, suffix=None):
         # Remove extension
         path_no_ext = os.path.splitext(rel_path)[0]
         
@@ -372,9 +521,11 @@ class SvgIconGenerator:
         # Join all parts with no spaces
         component_name = ''.join(processed_parts)
         
-        # Add prefix and suffix
-        prefix = self.component_prefix.get()
-        suffix = self.component_suffix.get()
+        # Add prefix and suffix (profiles pass their own, otherwise use the current settings)
+        if prefix is None:
+            prefix = self.component_prefix.get()
+        if suffix is None:
+            suffix = self.component_suffix.get()
         
         return f"{prefix}{component_name}{suffix}"
         
@@ -577,6 +728,409 @@ export default {component_name};
         except Exception as e:
             raise Exception(f"Error processing SVG: {str(e)}")
     
+    def create_bundle_header(self, framework, component_count):
+        header = [
+            "/**",
+            f" * Auto-generated {framework} icon bundle ({component_count} components)",
+            f" * Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            " */",
+            ""
+        ]
+        
+        if framework == "Vue":
+            # Props are shared by every component in the module
+            header.append("""import { h } from 'vue';
+
+const iconProps = {
+  size: {
+    type: [Number, String],
+    default: 24
+  },
+  strokeWidth: {
+    type: [Number, String],
+    default: 1.5
+  },
+  filled: {
+    type: Boolean,
+    default: false
+  },
+  customClass: {
+    type: String,
+    default: ''
+  }
+};
+""")
+        else:
+            header.append("import React from 'react';\n")
+            
+        return "\n".join(header)
+    
+    def create_vue_bundle_entry(self, svg_content, rel_path, component_name):
+        try:
+            # Extract SVG details
+            viewbox, svg_inner_content = self.extract_svg_details(svg_content)
+            
+            # Single-file components cannot share a module, so use a render function instead
+            return f"""/**
+ * {component_name}
+ * Generated from: {rel_path}
+ */
+export const {component_name} = {{
+  name: '{component_name}',
+  props: iconProps,
+  render() {{
+    return h('svg', {{
+      xmlns: 'http://www.w3.org/2000/svg',
+      width: this.size,
+      height: this.size,
+      'stroke-width': this.strokeWidth,
+      fill: this.filled ? 'currentColor' : 'none',
+      stroke: 'currentColor',
+      viewBox: {json.dumps(viewbox)},
+      class: this.customClass,
+      'stroke-linecap': 'round',
+      'stroke-linejoin': 'round',
+      innerHTML: {json.dumps(svg_inner_content)}
+    }});
+  }}
+}};
+"""
+        except Exception as e:
+            raise Exception(f"Error processing SVG: {str(e)}")
+    
+    def create_react_bundle_entry(self, svg_content, rel_path, component_name):
+        try:
+            # Extract SVG details
+            viewbox, svg_inner_content = self.extract_svg_details(svg_content)
+            
+            return f"""/**
+ * {component_name}
+ * Generated from: {rel_path}
+ */
+export const {component_name} = ({{ 
+  size = 24, 
+  strokeWidth = 1.5, 
+  filled = false, 
+  className = '', 
+  ...props 
+}}) => {{
+  return (
+    <svg
+      xmlns="http://www.w3.org/2000/svg"
+      width={{size}}
+      height={{size}}
+      strokeWidth={{strokeWidth}}
+      fill={{filled ? 'currentColor' : 'none'}}
+      stroke="currentColor"
+      viewBox="{viewbox}"
+      className={{className}}
+      strokeLinecap="round"
+      strokeLinejoin="round"
+      {{...props}}
+    >
+      {svg_inner_content}
+    </svg>
+  );
+}};
+"""
+        except Exception as e:
+            raise Exception(f"Error processing SVG: {str(e)}")
+    
+    def create_index_header(self):
+        return [
+            "/**",
+            f" * Auto-generated index file for SVG icon components",
+            f" * Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            " */", 
+            ""
+        ]
+    
+    def get_icon_name(self, rel_path):
+        # Registry keys are the source path without extension, e.g. "arrows/arrow-left"
+        return os.path.splitext(rel_path)[0].replace("\\", "/")
+    
+    def get_chunk_name(self, rel_path):
+        # Icons from the same source subfolder share a chunk
+        sub_dir = os.path.dirname(rel_path).replace("\\", "/")
+        chunk_suffix = re.sub(r'[^a-zA-Z0-9]+', '-', sub_dir).strip('-').lower()
+        return f"icons-{chunk_suffix}" if chunk_suffix else "icons"
+    
+    def create_registry(self, framework, registry_entries, group_chunks):
+        registry_content = [
+            "/**",
+            f" * Auto-generated lazy-loading registry for SVG icon components",
+            f" * Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            " */",
+            "",
+            "export const iconLoaders = {"
+        ]
+        
+        for rel_path, component_name, module_path, from_bundle in registry_entries:
+            icon_name = json.dumps(self.get_icon_name(rel_path))
+            
+            if from_bundle:
+                # Bundles are already chunked per shard, so pick the named export out of the shard
+                if framework == "Vue":
+                    loader = f"import('{module_path}').then((m) => m.{component_name})"
+                else:
+                    loader = f"import('{module_path}').then((m) => ({{ default: m.{component_name} }}))"
+            elif group_chunks:
+                loader = f"import(/* webpackChunkName: \"{self.get_chunk_name(rel_path)}\" */ '{module_path}')"
+            else:
+                loader = f"import('{module_path}')"
+                
+            registry_content.append(f"  {icon_name}: () => {loader},")
+            
+        registry_content.extend([
+            "};",
+            "",
+            "export const iconNames = Object.keys(iconLoaders);",
+            ""
+        ])
+        return "\n".join(registry_content)
+    
+    def create_vue_icon_loader_component(self):
+        timestamp = datetime.now().strftime("%Y-%m-%d")
+        return f"""<template>
+  <component :is="resolvedIcon" v-if="resolvedIcon" v-bind="$attrs" />
+</template>
+
+<script>
+/**
+ * Icon
+ * Loads icon components on demand from the lazy registry
+ * Date: {timestamp}
+ */
+import {{ defineAsyncComponent }} from 'vue';
+import {{ iconLoaders }} from './registry';
+
+const asyncIcons = {{}};
+
+export default {{
+  name: 'Icon',
+  inheritAttrs: false,
+  props: {{
+    name: {{
+      type: String,
+      required: true
+    }}
+  }},
+  computed: {{
+    resolvedIcon() {{
+      const loader = iconLoaders[this.name];
+      if (!loader) {{
+        return null;
+      }}
+      if (!asyncIcons[this.name]) {{
+        asyncIcons[this.name] = defineAsyncComponent(loader);
+      }}
+      return asyncIcons[this.name];
+    }}
+  }}
+}}
+</script>
+"""
+    
+    def create_react_icon_loader_component(self):
+        timestamp = datetime.now().strftime("%Y-%m-%d")
+        return f"""import React, {{ lazy, Suspense }} from 'react';
+import {{ iconLoaders }} from './registry';
+
+const lazyIcons = {{}};
+
+/**
+ * Icon
+ * Loads icon components on demand from the lazy registry
+ * Date: {timestamp}
+ */
+const Icon = ({{ name, fallback = null, ...props }}) => {{
+  const loader = iconLoaders[name];
+  if (!loader) {{
+    return null;
+  }}
+  if (!lazyIcons[name]) {{
+    lazyIcons[name] = lazy(loader);
+  }}
+  const LazyIcon = lazyIcons[name];
+  return (
+    <Suspense fallback={{fallback}}>
+      <LazyIcon {{...props}} />
+    </Suspense>
+  );
+}};
+
+export default Icon;
+"""
+    
+    def generate_registry(self, dest_path, framework, registry_entries, group_chunks):
+        try:
+            registry_path = os.path.join(dest_path, "registry.js")
+            with open(registry_path, 'w', encoding='utf-8') as registry_file:
+                registry_file.write(self.create_registry(framework, registry_entries, group_chunks))
+            self.log(f"Generated registry.js with {len(registry_entries)} lazy loaders")
+            
+            if framework == "Vue":
+                icon_path = os.path.join(dest_path, "Icon.vue")
+                icon_content = self.create_vue_icon_loader_component()
+            else:
+                icon_path = os.path.join(dest_path, "Icon.jsx")
+                icon_content = self.create_react_icon_loader_component()
+                
+            with open(icon_path, 'w', encoding='utf-8') as icon_file:
+                icon_file.write(icon_content)
+            self.log(f"Generated: {os.path.basename(icon_path)}")
+        except Exception as e:
+            self.log(f"Error generating registry.js: {str(e)}")
+    
+    def validate_svg(self, file_path, rel_path):
+        # Returns a list of (severity, code, message) tuples for a single SVG file
+        issues = []
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                svg_content = file.read()
+        except Exception as e:
+            return [("error", "unreadable", f"Cannot read file: {str(e)}")]
+            
+        try:
+            root = ET.fromstring(svg_content)
+        except ET.ParseError as e:
+            return [("error", "malformed", f"Not well-formed XML: {str(e)}")]
+            
+        if root.tag.rsplit('}', 1)[-1] != "svg":
+            issues.append(("error", "not-svg", f"Root element is <{root.tag.rsplit('}', 1)[-1]}>, expected <svg>"))
+        elif not re.search(r'<svg[^>]*>(.*?)</svg>', svg_content, re.DOTALL):
+            # extract_svg_details would otherwise embed the raw file content
+            issues.append(("error", "no-svg-body", "No <svg>...</svg> body found"))
+            
+        if "viewBox" not in root.attrib:
+            issues.append(("warning", "missing-viewbox", "Missing viewBox, falls back to 0 0 24 24"))
+            
+        path_data_length = 0
+        for element in root.iter():
+            tag = element.tag.rsplit('}', 1)[-1] if isinstance(element.tag, str) else ""
+            
+            if tag == "script":
+                issues.append(("error", "script", "Contains a <script> element"))
+            elif tag == "image":
+                href = next((value for name, value in element.attrib.items() if name.endswith("href")), "")
+                if href.strip().lower().startswith("data:image/"):
+                    issues.append(("error", "embedded-raster", "Contains an embedded raster image"))
+                else:
+                    issues.append(("warning", "external-image", f"References an external image: {href}"))
+            elif tag == "path":
+                path_data_length += len(element.get("d", ""))
+                
+            for name, value in element.attrib.items():
+                local_name = name.rsplit('}', 1)[-1].lower()
+                if local_name.startswith("on"):
+                    issues.append(("error", "event-handler", f"Event handler attribute '{local_name}' on <{tag}>"))
+                elif local_name == "href" and value.strip().lower().startswith("javascript:"):
+                    issues.append(("error", "script-url", f"javascript: URL on <{tag}>"))
+                    
+        if path_data_length > self.MAX_PATH_DATA_LENGTH:
+            issues.append(("warning", "oversized-path-data", f"Path data is {path_data_length} characters (limit {self.MAX_PATH_DATA_LENGTH})"))
+            
+        return issues
+    
+    def validate_svg_files(self, selected_files):
+        # Per-file checks are independent, so read and parse the files in parallel
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+            results = list(executor.map(lambda f: self.validate_svg(f[0], f[1]), selected_files))
+            
+        issues = []
+        for (file_path, rel_path, component_name), file_issues in zip(selected_files, results):
+            for severity, code, message in file_issues:
+                issues.append({
+                    'rel_path': rel_path,
+                    'component_name': component_name,
+                    'severity': severity,
+                    'code': code,
+                    'message': message
+                })
+                
+        # Name collisions overwrite each other on disk (case-insensitive filesystems included)
+        names = {}
+        for file_path, rel_path, component_name in selected_files:
+            names.setdefault(component_name.lower(), []).append((rel_path, component_name))
+        for colliding in names.values():
+            if len(colliding) < 2:
+                continue
+            for rel_path, component_name in colliding:
+                others = ", ".join(other for other, _ in colliding if other != rel_path)
+                issues.append({
+                    'rel_path': rel_path,
+                    'component_name': component_name,
+                    'severity': "error",
+                    'code': "name-collision",
+                    'message': f"Component name collides with: {others}"
+                })
+                
+        error_count = sum(1 for issue in issues if issue['severity'] == "error")
+        return {
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'summary': {
+                'files': len(selected_files),
+                'errors': error_count,
+                'warnings': len(issues) - error_count
+            },
+            'issues': issues
+        }
+    
+    def run_validation(self, selected_files, dest_path, fail_on_errors):
+        # Returns False when the batch should not be generated
+        self.log(f"Validating {len(selected_files)} SVG files")
+        self.status_var.set(f"Validating {len(selected_files)} SVG files...")
+        self.root.update()  # Force UI update
+        
+        report = self.validate_svg_files(selected_files)
+        summary = report['summary']
+        
+        # Only log a sample, the full list is in the report file
+        for issue in report['issues'][:50]:
+            self.log(f"{issue['severity'].upper()} [{issue['code']}] {issue['rel_path']}: {issue['message']}")
+        if len(report['issues']) > 50:
+            self.log(f"... {len(report['issues']) - 50} more issues")
+            
+        try:
+            report_path = os.path.join(dest_path, "validation-report.json")
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                json.dump(report, report_file, indent=2)
+            self.log(f"Validation report written to {report_path}")
+        except Exception as e:
+            self.log(f"Error writing validation report: {str(e)}")
+            
+        self.log(f"Validation completed: {summary['errors']} errors, {summary['warnings']} warnings")
+        
+        if summary['errors'] and fail_on_errors:
+            self.status_var.set(f"Validation failed: {summary['errors']} errors, {summary['warnings']} warnings (see validation-report.json)")
+            return False
+            
+        self.status_var.set(f"Validation completed: {summary['errors']} errors, {summary['warnings']} warnings")
+        return True
+    
+    def get_selected_files(self):
+        selected_files = []
+        for item in self.file_tree.selection():
+            file_path = self.file_tree.item(item, "tags")[0]
+            rel_path = self.file_tree.item(item)['values'][0]
+            component_name = self.file_tree.item(item)['values'][1]
+            selected_files.append((file_path, rel_path, component_name))
+        return selected_files
+    
+    def validate_selected(self):
+        dest_path = self.dest_path.get()
+        if not dest_path or not os.path.isdir(dest_path):
+            self.status_var.set("Please select a valid destination folder")
+            return
+            
+        selected_files = self.get_selected_files()
+        if not selected_files:
+            self.status_var.set("Please select SVG files to validate")
+            return
+            
+        self.run_validation(selected_files, dest_path, self.fail_on_errors.get())
+    
     def log(self, message):
         # Add timestamp to message
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -590,7 +1144,6 @@ export default {component_name};
         # Validate paths
         source_path = self.source_path.get()
         dest_path = self.dest_path.get()
-        framework = self.framework.get()
         
         if not source_path or not os.path.isdir(source_path):
             self.status_var.set("Please select a valid source folder")
@@ -600,39 +1153,51 @@ export default {component_name};
             self.status_var.set("Please select a valid destination folder")
             return
             
-        # Get selected items from the treeview
-        selected_items = self.file_tree.selection()
-        if not selected_items:
+        # Get the selected files information
+        selected_files = self.get_selected_files()
+        if not selected_files:
             self.status_var.set("Please select SVG files to generate components for")
             return
-        
-        # Get the selected files information
-        selected_files = []
-        for item in selected_items:
-            file_path = self.file_tree.item(item, "tags")[0]
-            rel_path = self.file_tree.item(item)['values'][0]
-            component_name = self.file_tree.item(item)['values'][1]
-            selected_files.append((file_path, rel_path, component_name))
             
+        settings = self.get_generation_settings()
+        
+        # Ask if user wants to preserve directory structure (bundles are always flat)
+        preserve_structure = False
+        if settings['output_mode'] != "Bundle":
+            preserve_structure = messagebox.askyesno(
+                "Preserve Directory Structure",
+                "Do you want to preserve the directory structure in the output folder?"
+            )
+        
+        self.run_generation(selected_files, dest_path, settings, preserve_structure)
+        
+    def run_generation(self, selected_files, dest_path, settings, preserve_structure):
+        framework = settings['framework']
+        
         # Log start of generation
         self.log(f"Starting {framework} component generation for {len(selected_files)} selected SVG files")
         self.log(f"Output folder: {dest_path}")
         
-        # Ask if user wants to preserve directory structure
-        preserve_structure = messagebox.askyesno(
-            "Preserve Directory Structure",
-            "Do you want to preserve the directory structure in the output folder?"
-        )
+        # Catch broken or unsafe icons before anything is written
+        if settings['validate_first'] and not self.run_validation(selected_files, dest_path, settings['fail_on_errors']):
+            self.log(f"{framework} component generation aborted due to validation errors")
+            return
+        
+        # Bundle mode writes a handful of large modules instead of one file per icon
+        if settings['output_mode'] == "Bundle":
+            self.generate_bundle(selected_files, dest_path, settings)
+        else:
+            self.generate_files(selected_files, dest_path, settings, preserve_structure)
+        
+    def generate_files(self, selected_files, dest_path, settings, preserve_structure):
+        framework = settings['framework']
         
         # Create index file for exporting all components
         file_extension = "js" if framework == "React" else "js"
-        index_content = [
-            "/**",
-            f" * Auto-generated index file for SVG icon components",
-            f" * Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            " */", 
-            ""
-        ]
+        index_content = self.create_index_header()
+        
+        # Lazy registry entries for successfully generated components
+        registry_entries = []
         
         # Track success and failures
         success_count = 0
@@ -661,17 +1226,20 @@ export default {component_name};
                     output_path = os.path.join(output_dir, f"{component_name}.vue")
                     path_for_import = os.path.join(os.path.dirname(rel_path), component_name).replace("\\", "/") if preserve_structure else component_name
                     index_content.append(f"export {{ default as {component_name} }} from './{path_for_import}.vue';")
+                    module_path = f"./{path_for_import}.vue"
                 else:
                     component_content = self.create_react_component(svg_content, rel_path, component_name)
                     output_path = os.path.join(output_dir, f"{component_name}.jsx")
                     path_for_import = os.path.join(os.path.dirname(rel_path), component_name).replace("\\", "/") if preserve_structure else component_name
                     index_content.append(f"export {{ default as {component_name} }} from './{path_for_import}';")
+                    module_path = f"./{path_for_import}"
                 
                 # Create the output file
                 with open(output_path, 'w', encoding='utf-8') as out_file:
                     out_file.write(component_content)
                 
                 # Log success
+                registry_entries.append((rel_path, component_name, module_path, False))
                 self.log(f"Generated: {os.path.basename(output_path)}")
                 success_count += 1
                 
@@ -692,10 +1260,242 @@ export default {component_name};
         except Exception as e:
             self.log(f"Error generating index.{file_extension}: {str(e)}")
         
+        # Write lazy-loading registry
+        if settings['lazy_registry']:
+            self.generate_registry(dest_path, framework, registry_entries, settings['group_chunks'])
+        
         # Final status update
         self.status_var.set(f"Completed: {success_count} {framework} components generated, {failure_count} failures")
         self.log(f"{framework} component generation completed")
         
+    def generate_bundle(self, selected_files, dest_path, settings):
+        framework = settings['framework']
+        shard_size = settings['shard_size']
+        self.log(f"Bundling {len(selected_files)} {framework} components (shard size: {shard_size or 'unlimited'})")
+        
+        # Render every component in memory first so each module is a single write
+        entries = []
+        failure_count = 0
+        
+        for processed, (file_path, rel_path, component_name) in enumerate(selected_files, 1):
+            try:
+                # Read SVG file
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    svg_content = file.read()
+                
+                if framework == "Vue":
+                    entry = self.create_vue_bundle_entry(svg_content, rel_path, component_name)
+                else:
+                    entry = self.create_react_bundle_entry(svg_content, rel_path, component_name)
+                entries.append((rel_path, component_name, entry))
+                    
+            except Exception as e:
+                self.log(f"Error processing {rel_path}: {str(e)}")
+                failure_count += 1
+                
+            # Refreshing the UI per file dominates large runs, so do it in batches
+            if processed % 250 == 0 or processed == len(selected_files):
+                self.status_var.set(f"Processed {processed} of {len(selected_files)} files...")
+                self.root.update()  # Force UI update
+        
+        # Split the rendered components into shards
+        if shard_size:
+            shards = [entries[i:i + shard_size] for i in range(0, len(entries), shard_size)]
+        else:
+            shards = [entries] if entries else []
+        
+        file_extension = "js" if framework == "Vue" else "jsx"
+        index_content = self.create_index_header()
+        registry_entries = []
+        success_count = 0
+        
+        # Write each shard with a single write call
+        for shard_number, shard in enumerate(shards, 1):
+            shard_name = "icons" if len(shards) == 1 else f"icons-{shard_number}"
+            shard_path = os.path.join(dest_path, f"{shard_name}.{file_extension}")
+            try:
+                module_content = self.create_bundle_header(framework, len(shard)) + "\n" + "\n".join(entry for _, _, entry in shard)
+                with open(shard_path, 'w', encoding='utf-8') as shard_file:
+                    shard_file.write(module_content)
+                    
+                index_content.append(f"export * from './{shard_name}';")
+                registry_entries.extend((rel_path, component_name, f"./{shard_name}", True) for rel_path, component_name, _ in shard)
+                self.log(f"Generated: {os.path.basename(shard_path)} ({len(shard)} components)")
+                success_count += len(shard)
+            except Exception as e:
+                self.log(f"Error writing {os.path.basename(shard_path)}: {str(e)}")
+                failure_count += len(shard)
+        
+        # Write index file
+        try:
+            index_path = os.path.join(dest_path, "index.js")
+            with open(index_path, 'w', encoding='utf-8') as index_file:
+                index_file.write("\n".join(index_content))
+            self.log(f"Generated index.js with {len(shards)} bundle exports")
+        except Exception as e:
+            self.log(f"Error generating index.js: {str(e)}")
+        
+        # Write lazy-loading registry
+        if settings['lazy_registry']:
+            self.generate_registry(dest_path, framework, registry_entries, settings['group_chunks'])
+        
+        # Final status update
+        self.status_var.set(f"Completed: {success_count} {framework} components bundled into {len(shards)} modules, {failure_count} failures")
+        self.log(f"{framework} bundle generation completed")
+        
+    def update_profile_list(self):
+        self.profile_combo['values'] = sorted(self.profiles)
+        
+    def parse_globs(self, text):
+        # Globs are separated by semicolons, e.g. "arrows/*; social/*"
+        return [pattern.strip() for pattern in text.split(';') if pattern.strip()]
+    
+    def parse_folder_rules(self, text):
+        rules = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if '=' not in line:
+                self.log(f"Ignoring folder rule without '=': {line}")
+                continue
+                
+            pattern, naming = line.split('=', 1)
+            prefix, _, suffix = naming.partition('|')
+            rules.append({'pattern': pattern.strip(), 'prefix': prefix.strip(), 'suffix': suffix.strip()})
+        return rules
+    
+    def format_folder_rules(self, rules):
+        return "\n".join(f"{rule['pattern']} = {rule['prefix']} | {rule['suffix']}" for rule in rules)
+    
+    def save_profile(self):
+        name = self.profile_name.get().strip()
+        if not name:
+            self.status_var.set("Please enter a profile name")
+            return
+            
+        # Capture the current generation settings along with the profile's own rules
+        profile = self.get_generation_settings()
+        profile.update({
+            'source_path': self.source_path.get(),
+            'dest_path': self.dest_path.get(),
+            'prefix': self.component_prefix.get(),
+            'suffix': self.component_suffix.get(),
+            'include': self.parse_globs(self.profile_include.get()),
+            'exclude': self.parse_globs(self.profile_exclude.get()),
+            'folder_rules': self.parse_folder_rules(self.profile_rules_area.get(1.0, tk.END)),
+            'preserve_structure': self.profile_preserve_structure.get()
+        })
+        
+        self.profiles[name] = profile
+        self.update_profile_list()
+        self.save_config()
+        
+        self.log(f"Saved profile: {name}")
+        self.status_var.set(f"Saved profile '{name}'")
+        
+    def load_profile(self):
+        name = self.profile_name.get().strip()
+        profile = self.profiles.get(name)
+        if profile is None:
+            self.status_var.set(f"Unknown profile '{name}'")
+            return
+            
+        self.framework.set(profile.get('framework', 'Vue'))
+        self.output_mode.set(profile.get('output_mode', 'Per File'))
+        self.shard_size.set(str(profile.get('shard_size', 0)))
+        self.lazy_registry.set(profile.get('lazy_registry', False))
+        self.group_chunks.set(profile.get('group_chunks', False))
+        self.validate_first.set(profile.get('validate_first', True))
+        self.fail_on_errors.set(profile.get('fail_on_errors', True))
+        self.component_prefix.set(profile.get('prefix', ''))
+        self.component_suffix.set(profile.get('suffix', 'Component'))
+        self.profile_include.set("; ".join(profile.get('include', [])))
+        self.profile_exclude.set("; ".join(profile.get('exclude', [])))
+        self.profile_preserve_structure.set(profile.get('preserve_structure', False))
+        
+        self.profile_rules_area.delete(1.0, tk.END)
+        self.profile_rules_area.insert(tk.END, self.format_folder_rules(profile.get('folder_rules', [])))
+        
+        if profile.get('source_path'):
+            self.source_path.set(profile['source_path'])
+        if profile.get('dest_path'):
+            self.dest_path.set(profile['dest_path'])
+            
+        self.log(f"Loaded profile: {name}")
+        
+    def delete_profile(self):
+        name = self.profile_name.get().strip()
+        if name not in self.profiles:
+            self.status_var.set(f"Unknown profile '{name}'")
+            return
+            
+        del self.profiles[name]
+        self.profile_name.set("")
+        self.update_profile_list()
+        self.save_config()
+        
+        self.log(f"Deleted profile: {name}")
+        
+    def select_profile_files(self, profile, svg_files):
+        include = profile.get('include', [])
+        exclude = profile.get('exclude', [])
+        folder_rules = profile.get('folder_rules', [])
+        
+        selected_files = []
+        for file_path, rel_path in svg_files:
+            # Globs always use forward slashes, regardless of platform
+            match_path = rel_path.replace("\\", "/")
+            
+            if include and not any(fnmatch(match_path, pattern) for pattern in include):
+                continue
+            if any(fnmatch(match_path, pattern) for pattern in exclude):
+                continue
+                
+            # The first matching folder rule overrides the profile's naming
+            prefix = profile.get('prefix', '')
+            suffix = profile.get('suffix', 'Component')
+            for rule in folder_rules:
+                if fnmatch(match_path, rule['pattern']):
+                    prefix = rule['prefix']
+                    suffix = rule['suffix']
+                    break
+                    
+            selected_files.append((file_path, rel_path, self.get_component_name(rel_path, prefix, suffix)))
+            
+        return selected_files
+    
+    def run_profile(self):
+        name = self.profile_name.get().strip()
+        profile = self.profiles.get(name)
+        if profile is None:
+            self.status_var.set(f"Unknown profile '{name}', save it before running")
+            return
+            
+        # Profiles run against their own folders, falling back to the current ones
+        source_path = profile.get('source_path') or self.source_path.get()
+        dest_path = profile.get('dest_path') or self.dest_path.get()
+        
+        if not source_path or not os.path.isdir(source_path):
+            self.status_var.set(f"Profile '{name}' has no valid source folder")
+            return
+            
+        if not dest_path or not os.path.isdir(dest_path):
+            self.status_var.set(f"Profile '{name}' has no valid destination folder")
+            return
+            
+        # Match against the whole catalogue without going through the treeview
+        self.log(f"Running profile: {name}")
+        selected_files = self.select_profile_files(profile, self.find_svg_files(source_path))
+        if not selected_files:
+            self.status_var.set(f"Profile '{name}' matched no SVG files")
+            return
+            
+        settings = self.get_generation_settings()
+        settings.update({key: profile[key] for key in settings if key in profile})
+        
+        self.run_generation(selected_files, dest_path, settings, profile.get('preserve_structure', False))
+        
     def open_output_folder(self):
         dest_path = self.dest_path.get()
         if not dest_path or not os.path.isdir(dest_path):